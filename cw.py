@@ -1,43 +1,147 @@
 import argparse
-import re
-from collections import Counter
+import functools
+import itertools
+import operator
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 DICT = Path(__file__).parent / "wordlist.txt"
+WILDCARDS = "?*."
 
 
+@functools.lru_cache(maxsize=1)
 def load_words() -> list[str]:
     """Load all alphabetic words from the system dictionary.
 
+    The dictionary is read once per process; later calls return the cached list,
+    which callers must treat as read-only.
+
     Returns:
         list[str]: Lowercase words containing only alphabetic characters.
     """
-    with open(DICT) as dict_file:
-        seen: set[str] = set()
-        words: list[str] = []
-        for word in dict_file:
-            word = word.strip().lower()
-            if word.isalpha() and word not in seen:
-                seen.add(word)
-                words.append(word)
-        return words
+    # Lowercase and split the whole file at once rather than line by line.
+    lines = map(str.strip, DICT.read_text().lower().splitlines())
+    # dict.fromkeys drops duplicates while keeping the first occurrence's position.
+    return list(dict.fromkeys(filter(str.isalpha, lines)))
+
+
+@functools.lru_cache(maxsize=1)
+def load_words_by_length() -> dict[int, list[str]]:
+    """Group the dictionary words by length.
+
+    Built once from :func:`load_words`, so each lookup only scans words of the
+    requested length. Within each bucket words keep their dictionary order.
+
+    Returns:
+        dict[int, list[str]]: Mapping from word length to the words of that length.
+    """
+    by_length: dict[int, list[str]] = {}
+    for word in load_words():
+        by_length.setdefault(len(word), []).append(word)
+    return by_length
+
+
+def _anagram_key(letters: str) -> str:
+    """Return the canonical form shared by every anagram of `letters`."""
+    return "".join(sorted(letters))
+
+
+@functools.lru_cache(maxsize=None)
+def _anagram_index(length: int) -> dict[str, list[str]]:
+    """Group the dictionary words of one length by their sorted letters.
+
+    Words that are anagrams of one another share a key, so finding every anagram
+    of a set of letters is a single dictionary lookup. Each length is indexed only
+    when first queried, so a one-off lookup only sorts the letters of one bucket.
+
+    Args:
+        length (int): Word length whose bucket to index.
+
+    Returns:
+        dict[str, list[str]]: Mapping from sorted letters to the words that use
+            exactly those letters, in dictionary order.
+    """
+    index: dict[str, list[str]] = {}
+    for word in load_words_by_length().get(length, []):
+        index.setdefault(_anagram_key(word), []).append(word)
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def letter_counts(letters: str, alphabet: str) -> tuple[int, ...]:
+    """Count how many times each character of `alphabet` occurs in `letters`.
+
+    Results are cached, so the histogram of each dictionary word is computed at
+    most once per alphabet. Characters outside `alphabet` are not counted.
+
+    Args:
+        letters (str): Lowercase letters to count.
+        alphabet (str): Distinct characters to count, e.g. the letters of a pool.
+
+    Returns:
+        tuple[int, ...]: One count per character, in `alphabet` order.
+    """
+    return tuple(letters.count(char) for char in alphabet)
+
+
+def _pack_counts(counts: tuple[int, ...], lane_bits: int) -> int:
+    """Pack a letter histogram into one int, `lane_bits` bits per letter."""
+    return sum(count << (lane_bits * index) for index, count in enumerate(counts))
+
+
+@functools.lru_cache(maxsize=None)
+def _length_buffer(length: int) -> bytes | None:
+    """Concatenate the dictionary words of one length into a single Latin-1 buffer.
+
+    Every word occupies exactly `length` bytes, so the letters at position i of all
+    the words form the column ``buffer[i::length]``.
+
+    Args:
+        length (int): Word length whose bucket to concatenate.
+
+    Returns:
+        bytes | None: The concatenated words, or None if some word has a character
+            outside Latin-1.
+    """
+    try:
+        return "".join(load_words_by_length().get(length, [])).encode("latin-1")
+    except UnicodeEncodeError:
+        return None
 
 
 def crossword_solver(pattern: str) -> list[str]:
     """Find dictionary words matching a pattern with wildcard characters.
 
-    Each '?' or '*' in the pattern matches exactly one unknown letter.
+    Each '?', '*' or '.' in the pattern matches exactly one unknown letter.
     Known letters must match exactly.
 
     Args:
-        pattern (str): A mix of letters and wildcard characters ('?' or '*'),
+        pattern (str): A mix of letters and wildcard characters ('?', '*' or '.'),
             e.g. '?u??t???' to find 8-letter words with 'u' second and 't' fifth.
 
     Returns:
         list[str]: Words from the dictionary that match the pattern.
     """
-    regex = "^" + re.sub(r"[?*.]", ".", pattern.lower()) + "$"
-    return [word for word in load_words() if re.match(regex, word)]
+    pattern = pattern.lower()
+    length = len(pattern)
+    words = load_words_by_length().get(length, [])
+    fixed = [(index, char) for index, char in enumerate(pattern) if char not in WILDCARDS]
+    buffer = _length_buffer(length)
+    if buffer is None:
+        return [word for word in words if all(word[index] == char for index, char in fixed)]
+
+    # Compare whole columns at once: translating column i maps the known letter to
+    # byte 1 and everything else to 0, and ANDing those masks as ints leaves a 1
+    # exactly for the words that match every known letter.
+    selected = (1 << (8 * len(words))) - 1
+    for index, char in fixed:
+        if ord(char) > 0xFF:
+            return []  # Cannot occur in a Latin-1 buffer.
+        table = bytearray(256)
+        table[ord(char)] = 1
+        selected &= int.from_bytes(buffer[index::length].translate(table))
+    return list(itertools.compress(words, selected.to_bytes(len(words))))
 
 
 def anagram(letters: str) -> list[str]:
@@ -54,71 +158,210 @@ def anagram(letters: str) -> list[str]:
         list[str]: Words from the dictionary that are exact anagrams of the input.
     """
     letters = letters.replace(" ", "").lower()
-    counts = Counter(letters)
-    length = len(letters)
-    return [word for word in load_words() if len(word) == length and Counter(word) == counts]
+    return list(_anagram_index(len(letters)).get(_anagram_key(letters), []))
 
 
 def _backtrack(
     slot_idx: int,
-    remaining: Counter,
-    chosen: list[str],
+    remaining: int,
+    slot_candidates: list[list[int]],
+    slot_letters: list[int],
+    same_as_next: list[bool],
+    last_slot_groups: dict[int, int],
+    guard: int,
+    ones: int,
+    memo: dict[tuple[int, int], list[tuple[int, int]]],
+) -> list[tuple[int, int]]:
+    # Different choices for earlier slots can leave the same pool behind, and the
+    # ways to fill the remaining slots depend only on the slot and the pool. Each
+    # state therefore records, once, the (group index, remaining pool) choices for
+    # its slot that can still be completed, in ascending group order.
+    key = (slot_idx, remaining)
+    if key in memo:
+        return memo[key]
+
+    choices: list[tuple[int, int]] = []
+    memo[key] = choices
+    if slot_idx == len(slot_candidates) - 1:
+        # The last word must use up the pool exactly, so look it up directly.
+        idx = last_slot_groups.get(remaining)
+        if idx is not None:
+            choices.append((idx, 0))
+        return choices
+
+    guarded = remaining | guard
+    # Dead end if a letter left in the pool is not used by any word in the open slots.
+    if (guarded - ones) & guard & ~slot_letters[slot_idx]:
+        return choices
+
+    candidates = slot_candidates[slot_idx]
+    next_same_length = same_as_next[slot_idx]
+
+    for idx in range(len(candidates)):
+        # A lane keeps its guard bit only if it held at least the candidate's count.
+        difference = guarded - candidates[idx]
+        if difference & guard == guard:
+            rest = difference ^ guard
+            later = _backtrack(
+                slot_idx + 1,
+                rest,
+                slot_candidates,
+                slot_letters,
+                same_as_next,
+                last_slot_groups,
+                guard,
+                ones,
+                memo,
+            )
+            # A following slot of the same length may not choose an earlier group.
+            if later and (not next_same_length or later[-1][0] >= idx):
+                choices.append((idx, rest))
+    return choices
+
+
+def _walk_choices(
+    slot_idx: int,
+    remaining: int,
     min_idx: int,
-    sorted_lengths: list[int],
-    words_by_length: dict[int, list[tuple[Counter, str]]],
-    results: list[tuple[str, ...]],
-) -> None:
-    if slot_idx == len(sorted_lengths):
-        results.append(tuple(chosen))
+    same_as_next: list[bool],
+    memo: dict[tuple[int, int], list[tuple[int, int]]],
+) -> Iterator[tuple[int, ...]]:
+    """Yield every combination of group indices recorded by :func:`_backtrack`."""
+    if slot_idx == len(same_as_next):
+        yield ()
         return
+    next_same_length = same_as_next[slot_idx]
+    for idx, rest in memo[slot_idx, remaining]:
+        if idx >= min_idx:
+            for tail in _walk_choices(
+                slot_idx + 1, rest, idx if next_same_length else 0, same_as_next, memo
+            ):
+                yield (idx, *tail)
 
-    length = sorted_lengths[slot_idx]
-    next_same_length = slot_idx + 1 < len(sorted_lengths) and sorted_lengths[slot_idx + 1] == length
 
-    for idx in range(min_idx, len(words_by_length[length])):
-        candidate_counter, candidate = words_by_length[length][idx]
-        if candidate_counter <= remaining:
-            chosen.append(candidate)
-            _backtrack(
-                slot_idx + 1,
-                remaining - candidate_counter,
-                chosen,
-                idx + 1 if next_same_length else 0,
-                sorted_lengths,
-                words_by_length,
-                results,
-            )
-            chosen.pop()
+def _candidate_groups(
+    length: int, alphabet: str, pool: tuple[int, ...], lane_bits: int
+) -> dict[int, list[int]]:
+    """Group the words of one length that fit in `pool` by their packed histogram.
+
+    Groups are ordered so that those using the pool's scarcest letters come first:
+    once those letters are consumed, later slots have few candidates left and the
+    search prunes early.
 
+    Args:
+        length (int): Word length to collect candidates for.
+        alphabet (str): The distinct letters of the pool.
+        pool (tuple[int, ...]): Letter counts available, in `alphabet` order.
+        lane_bits (int): Lane width used to pack the histograms.
 
-def multianagram(letters: str, lengths: list[int]) -> list[tuple[str, ...]]:
+    Returns:
+        dict[int, list[int]]: Mapping from packed histogram to the indices of its
+            words in the length bucket, rarest histograms first.
+    """
+    groups: dict[int, list[int]] = {}
+    rarity: dict[int, float] = {}
+    for word_idx, word in enumerate(load_words_by_length().get(length, [])):
+        # Cheap sieve: stripping the pool's letters must leave nothing behind.
+        if word.strip(alphabet):
+            continue
+        word_counts = letter_counts(word, alphabet)
+        if all(need <= have for need, have in zip(word_counts, pool, strict=True)):
+            packed = _pack_counts(word_counts, lane_bits)
+            if packed not in groups:
+                groups[packed] = []
+                rarity[packed] = sum(
+                    1 / have for need, have in zip(word_counts, pool, strict=True) if need
+                )
+            groups[packed].append(word_idx)
+    return dict(sorted(groups.items(), key=lambda group: rarity[group[0]], reverse=True))
+
+
+def _expand_groups(
+    group_combo: tuple[int, ...], slot_groups: list[list[list[int]]], same_as_next: list[bool]
+) -> Iterator[tuple[int, ...]]:
+    """Yield every combination of word indices represented by one choice of groups.
+
+    Slots of equal length that chose the same group take distinct words from it,
+    and the word indices within each run of equal-length slots are kept in ascending
+    order so that every unordered combination is produced once.
+    """
+    span_choices: list[list[list[int]]] = []
+    start = 0
+    while start < len(group_combo):
+        end = start + 1
+        while same_as_next[end - 1]:
+            end += 1
+        runs = [
+            itertools.combinations(slot_groups[start][group], len(list(run)))
+            for group, run in itertools.groupby(group_combo[start:end])
+        ]
+        span_choices.append(
+            [sorted(itertools.chain.from_iterable(parts)) for parts in itertools.product(*runs)]
+        )
+        start = end
+    for spans in itertools.product(*span_choices):
+        yield tuple(itertools.chain.from_iterable(spans))
+
+
+def multianagram(letters: str, lengths: list[int]) -> Iterator[tuple[str, ...]]:
     """Find all combinations of dictionary words that together anagram the given letters.
 
     Each result is a tuple containing one word per entry in `lengths`, where the
     word at position i has exactly `lengths[i]` characters. Taken together, the
-    words in each tuple use every supplied letter exactly once.
+    words in each tuple use every supplied letter exactly once. Results are
+    produced lazily, so large result sets need not be held in memory at once.
 
     Algorithm:
-        Pre-filtering: Before backtracking starts, every word in the dictionary is
-        tested against two cheap conditions: its length must appear in `lengths`, and
-        its per-letter counts must all be within the original letter pool (Counter
-        subset test). This eliminates the vast majority of dictionary entries upfront,
-        keeping the candidate lists small.
-
-        Sorting for deduplication: `lengths` is sorted so that equal values are
-        adjacent. When two or more consecutive slots share the same required length,
-        later slots are only allowed to choose from words at a higher list index than
-        the word chosen by the earlier slot. This enforces an implicit ordering that
-        guarantees each unordered combination appears exactly once — ("cat", "dog")
-        and ("dog", "cat") are not both emitted.
-
-        Backtracking with Counter arithmetic: the algorithm fills one slot per
-        recursive call. It subtracts the chosen word's Counter from the remaining
-        letter pool before recursing, and restores it on backtrack. Counter's `<=`
-        operator (subset check) and `-` operator both run in O(alphabet size),
-        so candidate testing and pool updates are cheap regardless of word length.
-        Any branch where no word of the required length fits the remaining pool is
-        pruned immediately without generating further candidates.
+        Pre-filtering: Before backtracking starts, only the dictionary words whose
+        length appears in `lengths` are considered (via the length-bucketed index). A
+        word is first rejected if it contains any letter missing from the pool, which a
+        single ``str.strip`` call detects, and only then must its per-letter counts fit
+        within the original letter pool. This eliminates the vast majority of dictionary
+        entries upfront, keeping the candidate lists small. Within each length, the
+        groups described below are ordered so that those using the pool's scarcest
+        letters are tried first; consuming those letters early leaves later slots with
+        few fitting candidates.
+
+        Grouping anagrams: candidates of the same length with identical letter counts
+        (e.g. "pots", "stop" and "tops") lead to identical searches, so the search
+        branches once per distinct letter histogram and every combination of groups it
+        finds is expanded into the words of those groups at the end.
+
+        Sorting slots: the slots are filled in order of descending length. Each long
+        word consumes many letters, so the pool, and with it the number of fitting
+        candidates for the remaining slots, shrinks as quickly as possible. Sorting also
+        makes equal lengths adjacent, which the deduplication below relies on; results
+        are reordered to match `lengths` before they are returned.
+
+        Deduplication: when two or more consecutive slots share the same required
+        length, later slots are only allowed to choose from groups at the same or a
+        higher list index than the group chosen by the earlier slot, and slots sharing a
+        group take distinct words from it in list order. This enforces an implicit
+        ordering that guarantees each unordered combination appears exactly once —
+        ("cat", "dog") and ("dog", "cat") are not both emitted.
+
+        Backtracking with letter histograms: each word's letter counts are computed once
+        and cached as a tuple with one entry per distinct letter of the pool. The
+        algorithm fills one slot per recursive call, passing down the remaining letter
+        pool with the chosen word's counts subtracted. For the search, each histogram is
+        packed into a single int with one fixed-width lane per letter, each lane wide
+        enough for the largest pool count plus a guard bit. Setting every guard bit in
+        the pool and subtracting a candidate clears the guard bit of exactly those lanes
+        where the candidate needs more letters than remain, so the subset check and the
+        pool update cost one big-int subtraction, mask and XOR each, regardless of word
+        length. Any branch where no word of the required length fits the remaining pool
+        is pruned immediately without generating further candidates. Likewise, a branch
+        is abandoned as soon as the remaining pool holds a letter that no candidate of
+        any still-open slot contains. The last slot needs no search at all: its word
+        must use up exactly the letters that remain, so its group is found with a single
+        dictionary lookup.
+
+        Memoizing search states: different choices for the earlier slots often leave the
+        same letters behind, and how the remaining slots can be filled depends only on
+        the slot and the remaining pool. The search therefore works out the viable group
+        choices of each (slot, remaining pool) state once, then reads the combinations
+        back by walking the memoized states. Only group indices are recorded; the words
+        themselves are looked up at the very end.
 
     Args:
         letters (str): The full set of letters to use, optionally space-separated.
@@ -127,8 +370,8 @@ def multianagram(letters: str, lengths: list[int]) -> list[tuple[str, ...]]:
             3-letter and a 5-letter word that together use every letter exactly once.
 
     Returns:
-        list[tuple[str, ...]]: Each tuple contains one word per entry in `lengths`
-            (ordered by ascending length) that together anagram the input letters.
+        Iterator[tuple[str, ...]]: Each tuple contains one word per entry in `lengths`,
+            in the same order as `lengths`, that together anagram the input letters.
 
     Raises:
         ValueError: If ``sum(lengths)`` does not equal the number of letters.
@@ -140,23 +383,67 @@ def multianagram(letters: str, lengths: list[int]) -> list[tuple[str, ...]]:
             f"Lengths {lengths} sum to {total}, but {len(letters)} letters were given."
         )
 
-    pool = Counter(letters)
+    # Histograms only have lanes for the pool's own letters, whatever they are.
+    alphabet = "".join(sorted(set(letters)))
+    pool = letter_counts(letters, alphabet)
     needed_lengths = set(lengths)
-    sorted_lengths = sorted(lengths)
+    # Slots are filled longest first; slot_order[i] is the position in `lengths`
+    # that slot i fills.
+    slot_order = sorted(range(len(lengths)), key=lengths.__getitem__, reverse=True)
+    sorted_lengths = [lengths[position] for position in slot_order]
 
-    # Pre-filter: only keep words of a needed length whose letters all fit in the pool.
-    words_by_length: dict[int, list[tuple[Counter, str]]] = {
-        length: [] for length in needed_lengths
-    }
-    for word in load_words():
-        if len(word) in needed_lengths:
-            word_counter = Counter(word)
-            if word_counter <= pool:
-                words_by_length[len(word)].append((word_counter, word))
+    # Each lane is wide enough for the largest pool count plus a guard bit.
+    lane_bits = max(pool, default=0).bit_length() + 1
+    ones = _pack_counts((1,) * len(alphabet), lane_bits)
+    guard = ones << (lane_bits - 1)
 
-    results: list[tuple[str, ...]] = []
-    _backtrack(0, pool, [], 0, sorted_lengths, words_by_length, results)
-    return results
+    # Pre-filter: only keep words of a needed length whose letters all fit in the pool.
+    # Words sharing a packed histogram are interchangeable, so they are grouped and
+    # each group records the words' indices in the length bucket.
+    groups_by_length: dict[int, dict[int, list[int]]] = {}
+    # Guard bits of every letter used by at least one candidate of each length.
+    letters_by_length: dict[int, int] = dict.fromkeys(needed_lengths, 0)
+    for length in needed_lengths:
+        groups = groups_by_length[length] = _candidate_groups(length, alphabet, pool, lane_bits)
+        for packed in groups:
+            letters_by_length[length] |= ((packed | guard) - ones) & guard
+
+    # The search only sees packed histograms and reports group indices.
+    slot_candidates = [list(groups_by_length[length]) for length in sorted_lengths]
+    # slot_letters[i] covers every letter usable by slots i onwards.
+    slot_letters = list(
+        itertools.accumulate(
+            (letters_by_length[length] for length in reversed(sorted_lengths)),
+            operator.or_,
+        )
+    )[::-1]
+    same_as_next = [a == b for a, b in itertools.pairwise([*sorted_lengths, None])]
+    last_slot_groups = (
+        {packed: idx for idx, packed in enumerate(slot_candidates[-1])} if slot_candidates else {}
+    )
+    packed_pool = _pack_counts(pool, lane_bits)
+    memo: dict[tuple[int, int], list[tuple[int, int]]] = {}
+    if slot_candidates:
+        _backtrack(
+            0,
+            packed_pool,
+            slot_candidates,
+            slot_letters,
+            same_as_next,
+            last_slot_groups,
+            guard,
+            ones,
+            memo,
+        )
+    slot_groups = [list(groups_by_length[length].values()) for length in sorted_lengths]
+    slot_words = [load_words_by_length().get(length, []) for length in sorted_lengths]
+    # Report each combination in the order of `lengths` rather than slot order.
+    output_slots = sorted(range(len(slot_order)), key=slot_order.__getitem__)
+    return (
+        tuple(slot_words[slot][combo[slot]] for slot in output_slots)
+        for group_combo in _walk_choices(0, packed_pool, 0, same_as_next, memo)
+        for combo in _expand_groups(group_combo, slot_groups, same_as_next)
+    )
 
 
 def main() -> None:
@@ -187,12 +474,14 @@ def main() -> None:
 
     if args.m:
         lengths = [int(x) for x in args.m.split(",")]
-        for combo in sorted(multianagram(text, lengths)):
-            print(" ".join(combo))
+        sys.stdout.writelines(
+            " ".join(combo) + "\n" for combo in sorted(multianagram(text, lengths))
+        )
     else:
         results = anagram(text) if args.a else crossword_solver(text)
         words = sorted(results)
-        col_width = max((len(word) for word in words), default=0) + 2
+        # Every result has the input's length, ignoring spaces between anagram letters.
+        col_width = len(text.replace(" ", "") if args.a else text) + 2
         for index, word in enumerate(words):
             end = "\n" if index % args.n == args.n - 1 or index == len(words) - 1 else ""
             print(word.ljust(col_width), end=end)
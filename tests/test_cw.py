@@ -0,0 +1,141 @@
+import itertools
+import sys
+from collections import Counter
+
+import cw
+import pytest
+from cw import (
+    anagram,
+    crossword_solver,
+    load_words,
+    load_words_by_length,
+    main,
+    multianagram,
+)
+
+
+@pytest.mark.parametrize("pattern", ["s?o?", "?u??t???", "Cat", "...", "q?z", "?" * 40, ""])
+def test_crossword_solver_fallback_agrees_with_buffer(pattern, monkeypatch):
+    expected = crossword_solver(pattern)
+    monkeypatch.setattr(cw, "_length_buffer", lambda length: None)
+    assert crossword_solver(pattern) == expected
+
+
+def test_crossword_solver_matches_known_letters():
+    results = crossword_solver("s?o?")
+    assert "stop" in results
+    assert all(len(word) == 4 and word[0] == "s" and word[2] == "o" for word in results)
+
+
+@pytest.mark.parametrize(
+    "letters", ["stop", "u q s o t e n i", "ELAST", "gardaí", "iadr ág", "zzz", ""]
+)
+def test_anagram_matches_counter_reference(letters):
+    letters_only = letters.replace(" ", "").lower()
+    pool = Counter(letters_only)
+    expected = [
+        word for word in load_words() if len(word) == len(letters_only) and Counter(word) == pool
+    ]
+    assert anagram(letters) == expected
+
+
+def test_anagram_finds_non_ascii_words():
+    assert "gardaí" in anagram("í a d r a g")
+
+
+def brute_force_multianagram(letters, lengths):
+    """Reference search: every tuple of words whose letters exactly use `letters`.
+
+    Words in equal-length slots are taken in increasing dictionary order, matching the
+    deduplication done by `multianagram`.
+    """
+    pool = Counter(letters.replace(" ", ""))
+    buckets = [
+        [word for word in load_words_by_length().get(length, []) if Counter(word) <= pool]
+        for length in lengths
+    ]
+    results = set()
+    for combo in itertools.product(*buckets):
+        if Counter("".join(combo)) != pool:
+            continue
+        by_length = {}
+        for length, word in zip(lengths, combo, strict=True):
+            by_length.setdefault(length, []).append(word)
+        if all(words == sorted(set(words)) for words in by_length.values()):
+            results.add(combo)
+    return sorted(results)
+
+
+@pytest.mark.parametrize(
+    ("letters", "lengths"),
+    [
+        ("ab", [0, 2]),
+        ("vox", [3, 0]),
+        ("abc", [-1, 4]),
+        ("abc", [50, -47]),
+        ("abcdefghijklmnopqrstuvwxyzab", [26, 2]),
+    ],
+)
+def test_multianagram_length_without_words_is_empty(letters, lengths):
+    assert list(multianagram(letters, lengths)) == []
+
+
+@pytest.mark.parametrize(
+    ("letters", "lengths"),
+    [
+        ("pots", [4]),
+        ("stoppots", [4, 4]),
+        ("stoppots", [3, 5]),
+        ("stoppots", [5, 3]),
+        ("tops pots", [4, 4]),
+        ("listen", [3, 3]),
+        ("parts", [1, 2, 2]),
+        ("gardaí", [6]),
+        ("gardaí stop", [4, 6]),
+    ],
+)
+def test_multianagram_matches_brute_force(letters, lengths):
+    assert sorted(multianagram(letters, lengths)) == brute_force_multianagram(letters, lengths)
+
+
+def test_multianagram_uses_letters_outside_ascii():
+    assert list(multianagram("gardaí", [6])) == [("gardaí",)]
+
+
+def test_multianagram_pairs_words_sharing_a_histogram():
+    results = list(multianagram("stoppots", [4, 4]))
+    assert ("post", "pots") in results
+    assert ("pots", "post") not in results
+    assert len(results) == len(set(results))
+
+
+def test_multianagram_keeps_lengths_order():
+    results = list(multianagram("stoppots", [5, 3]))
+    assert results
+    assert all(list(map(len, combo)) == [5, 3] for combo in results)
+
+
+def test_multianagram_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        multianagram("stop", [3])
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["-a", "post"], "opts  post  pots  spot  stop  \ntops  \n"),
+        (["-a", "-n", "4", "s", "t", "o", "p"], "opts  post  pots  spot  \nstop  tops  \n"),
+        (["q??z"], "quiz  \n"),
+        (["dum?"], "duma  dumb  dump  \n"),
+        (["-n", "2", "?ui?k"], "quick  quirk  \n"),
+        (["-a", "zzzz"], ""),
+        (
+            ["-m", "4,6", "stop", "gardaí"],
+            "opts gardaí\npost gardaí\npots gardaí\nspot gardaí\nstop gardaí\ntops gardaí\n",
+        ),
+    ],
+)
+def test_main_output(argv, expected, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["cw.py", *argv])
+    main()
+    assert capsys.readouterr().out == expected